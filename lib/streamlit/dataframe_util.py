@@ -915,6 +915,12 @@ def convert_anything_to_list(obj: OptionSequence[V_co]) -> list[V_co]:
     if obj is None:
         return []  # type: ignore
 
+    if isinstance(obj, (list, tuple)) and not is_snowpark_row_list(obj):
+        # Optimization to check the most common types first. This skips the
+        # ABC-based isinstance checks below. It also ensures that the sequence
+        # is copied to prevent potential mutations to the original object.
+        return list(obj)
+
     if isinstance(obj, (str, int, float, bool)):
         # Wrap basic objects into a list
         return [obj]
@@ -932,6 +938,23 @@ def convert_anything_to_list(obj: OptionSequence[V_co]) -> list[V_co]:
         # potential mutations to the original object.
         return list(obj)
 
+    if is_type(obj, "pandas.core.series.Series"):
+        # Series and one-dimensional arrays are very common as options. For these,
+        # we can skip the conversion to a DataFrame below since we would only use
+        # the first (and only) column anyway. to_list always returns a new list.
+        return cast(List[V_co], cast(Any, obj).to_list())
+
+    if (
+        is_type(obj, "numpy.ndarray")
+        and cast(Any, obj).ndim == 1
+        # Structured arrays can't be converted to a Series, so we leave them to the
+        # DataFrame conversion below, which uses their first field as first column.
+        and cast(Any, obj).dtype.names is None
+    ):
+        import pandas as pd
+
+        return cast(List[V_co], pd.Series(obj).to_list())
+
     # Fallback to our DataFrame conversion logic:
     try:
         # We use ensure_copy here because the return value of this function is
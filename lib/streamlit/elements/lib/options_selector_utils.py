@@ -29,6 +29,9 @@ from streamlit.type_util import (
 _LOGGER: Final = logger.get_logger(__name__)
 
 _FLOAT_EQUALITY_EPSILON: Final[float] = 0.000000000005
+# Building an option -> index map costs about as much as a handful of linear scans
+# over the options, so we only build it if there are at least this many defaults.
+_MIN_DEFAULTS_FOR_INDEX_MAP: Final = 8
 _Value = TypeVar("_Value")
 
 
@@ -48,10 +51,13 @@ def index_(iterable: Iterable[_Value], x: _Value) -> int:
     -------
     int
     """
+    # The float tolerance check only applies if x is a float, so we check
+    # this once instead of for every item.
+    x_is_float = isinstance(x, float)
     for i, value in enumerate(iterable):
         if x == value:
             return i
-        elif isinstance(value, float) and isinstance(x, float):
+        elif x_is_float and isinstance(value, float):
             if abs(x - value) < _FLOAT_EQUALITY_EPSILON:
                 return i
     raise ValueError(f"{str(x)} is not in iterable")
@@ -65,15 +71,35 @@ def check_and_convert_to_indices(
         return None
 
     default_values = convert_anything_to_list(default_values)
-
+    if not default_values:
+        return []
+
+    # Map every option to the index of its first occurrence, so that we don't
+    # need to do a linear scan of the options for every default value.
+    option_indices: dict[Any, int] = {}
+    if len(default_values) >= _MIN_DEFAULTS_FOR_INDEX_MAP:
+        try:
+            for index, option in enumerate(opt):
+                option_indices.setdefault(option, index)
+        except TypeError:
+            # Some options are not hashable, so we rely on the linear scan below.
+            option_indices = {}
+
+    indices: list[int] = []
     for value in default_values:
-        if value not in opt:
-            raise StreamlitAPIException(
-                f"The default value '{value}' is not part of the options. "
-                "Please make sure that every default values also exists in the options."
-            )
-
-    return [opt.index(value) for value in default_values]
+        try:
+            indices.append(option_indices[value])
+        except (KeyError, TypeError):
+            # The value is either not hashable, not part of the options, equal
+            # to an option without sharing its hash, or we didn't build the map.
+            if value not in opt:
+                raise StreamlitAPIException(
+                    f"The default value '{value}' is not part of the options. "
+                    "Please make sure that every default values also exists in the options."
+                )
+            indices.append(opt.index(value))
+
+    return indices
 
 
 def convert_to_sequence_and_check_comparable(options: OptionSequence[T]) -> Sequence[T]:
@@ -25,6 +25,7 @@ from streamlit.errors import (
     StreamlitValueAssignmentNotAllowedError,
 )
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    ScriptRunContext,
     get_script_run_ctx,
     in_cached_function,
 )
@@ -55,7 +56,10 @@ _shown_default_value_warning: bool = False
 
 
 def check_session_state_rules(
-    default_value: Any, key: str | None, writes_allowed: bool = True
+    default_value: Any,
+    key: str | None,
+    writes_allowed: bool = True,
+    ctx: ScriptRunContext | None = None,
 ) -> None:
     """Ensures that no values are set for widgets with the given key when writing
     is not allowed.
@@ -63,6 +67,9 @@ def check_session_state_rules(
     Additionally, if `global.disableWidgetStateDuplicationWarning` is False a warning is
     shown when a widget has a default value but its value is also set via session state.
 
+    If a script run context is passed in, its session state is used instead of
+    looking up the current context again.
+
     Raises
     ------
     StreamlitAPIException:
@@ -73,7 +80,7 @@ def check_session_state_rules(
     if key is None or not runtime.exists():
         return
 
-    session_state = get_session_state()
+    session_state = ctx.session_state if ctx is not None else get_session_state()
     if not session_state.is_new_state_value(key):
         return
 
@@ -124,7 +131,7 @@ def check_cache_replay_rules() -> None:
         exception(CachedWidgetWarning())
 
 
-def check_fragment_path_policy(dg: DeltaGenerator):
+def check_fragment_path_policy(dg: DeltaGenerator, ctx: ScriptRunContext | None = None):
     """Ensures that the current widget is not written outside of the
     fragment's delta path.
 
@@ -132,9 +139,12 @@ def check_fragment_path_policy(dg: DeltaGenerator):
     We don't allow writing widgets from within a widget to the outside path
     because it can lead to unexpected behavior. For elements, this is okay
     because they do not trigger a re-run.
+
+    If no script run context is passed in, the current one is looked up.
     """
 
-    ctx = get_script_run_ctx()
+    if ctx is None:
+        ctx = get_script_run_ctx()
     # Check is only relevant for fragments
     if ctx is None or ctx.current_fragment_id is None:
         return
@@ -168,12 +178,15 @@ def check_widget_policies(
     enable_check_callback_rules: bool = True,
 ):
     """Check all widget policies for the given DeltaGenerator."""
-    check_fragment_path_policy(dg)
+    # Look up the script run context only once and share it with the policies
+    # that need it.
+    ctx = get_script_run_ctx()
+    check_fragment_path_policy(dg, ctx=ctx)
     check_cache_replay_rules()
     if enable_check_callback_rules:
         check_callback_rules(dg, on_change)
     check_session_state_rules(
-        default_value=default_value, key=key, writes_allowed=writes_allowed
+        default_value=default_value, key=key, writes_allowed=writes_allowed, ctx=ctx
     )
 
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -87,6 +88,8 @@ _STAR_ICON: Final = ":material/star:"
 _SELECTED_STAR_ICON: Final = ":material/star_filled:"
 
 SelectionMode: TypeAlias = Literal["single", "multiple"]
+_SELECTION_MODES: Final = ("single", "multiple")
+_STYLES: Final = ("segment", "pills", "borderless")
 
 
 class SingleSelectSerde(Generic[T]):
@@ -157,33 +160,71 @@ class SingleOrMultiSelectSerde(Generic[T]):
         return self.serde.deserialize(ui_value, widget_id)
 
 
-def get_mapped_options(
-    feedback_option: Literal["thumbs", "faces", "stars"],
-) -> tuple[list[ButtonGroupProto.Option], list[int]]:
-    # options object understandable by the web app
-    options: list[ButtonGroupProto.Option] = []
-    # we use the option index in the webapp communication to
-    # indicate which option is selected
-    options_indices: list[int] = []
-
-    if feedback_option == "thumbs":
-        # reversing the index mapping to have thumbs up first (but still with the higher
-        # index (=sentiment) in the list)
-        options_indices = list(reversed(range(len(_THUMB_ICONS))))
-        options = [ButtonGroupProto.Option(content_icon=icon) for icon in _THUMB_ICONS]
-    elif feedback_option == "faces":
-        options_indices = list(range(len(_FACES_ICONS)))
-        options = [ButtonGroupProto.Option(content_icon=icon) for icon in _FACES_ICONS]
-    elif feedback_option == "stars":
-        options_indices = list(range(_NUMBER_STARS))
-        options = [
+# The mapped options only depend on the constants above, so we build them once at
+# import time instead of on every st.feedback call. For every feedback option, this
+# holds the option protos understandable by the web app and the option indices
+# used in the webapp communication to indicate which option is selected.
+_MAPPED_FEEDBACK_OPTIONS: Final[
+    dict[str, tuple[tuple[ButtonGroupProto.Option, ...], tuple[int, ...]]]
+] = {
+    # reversing the index mapping to have thumbs up first (but still with the higher
+    # index (=sentiment) in the list)
+    "thumbs": (
+        tuple(ButtonGroupProto.Option(content_icon=icon) for icon in _THUMB_ICONS),
+        tuple(reversed(range(len(_THUMB_ICONS)))),
+    ),
+    "faces": (
+        tuple(ButtonGroupProto.Option(content_icon=icon) for icon in _FACES_ICONS),
+        tuple(range(len(_FACES_ICONS))),
+    ),
+    "stars": (
+        (
             ButtonGroupProto.Option(
                 content_icon=_STAR_ICON,
                 selected_content_icon=_SELECTED_STAR_ICON,
-            )
-        ] * _NUMBER_STARS
+            ),
+        )
+        * _NUMBER_STARS,
+        tuple(range(_NUMBER_STARS)),
+    ),
+}
 
-    return options, options_indices
+
+def get_mapped_options(
+    feedback_option: Literal["thumbs", "faces", "stars"],
+) -> tuple[tuple[ButtonGroupProto.Option, ...], tuple[int, ...]]:
+    """Return the shared option protos and indices for the given feedback option.
+
+    The returned protos are shared between all calls and must not be mutated.
+    """
+    return _MAPPED_FEEDBACK_OPTIONS.get(feedback_option, ((), ()))
+
+
+def _transformed_format_func(
+    format_func: Callable[[Any], str] | None, option: V
+) -> ButtonGroupProto.Option:
+    """If option starts with a material icon or an emoji, we extract it to send
+    it parsed to the frontend."""
+    transformed = format_func(option) if format_func else str(option)
+    transformed_parts = transformed.split(" ")
+    icon: str | None = None
+    if len(transformed_parts) > 0:
+        maybe_icon = transformed_parts[0].strip()
+        try:
+            # we only want to extract material icons because we treat them
+            # differently than emojis visually
+            if maybe_icon.startswith(":material"):
+                icon = validate_material_icon(maybe_icon)
+                # reassamble the option string without the icon - also
+                # works if len(transformed_parts) == 1
+                transformed = " ".join(transformed_parts[1:])
+        except StreamlitAPIException:
+            # we don't have a valid icon or emoji, so we just pass
+            pass
+    return ButtonGroupProto.Option(
+        content=transformed,
+        content_icon=icon,
+    )
 
 
 def _build_proto(
@@ -219,15 +260,14 @@ def _build_proto(
         if help is not None:
             proto.help = help
 
-    for formatted_option in formatted_options:
-        proto.options.append(formatted_option)
+    proto.options.extend(formatted_options)
     proto.selection_visualization = selection_visualization
     return proto
 
 
 def _maybe_raise_selection_mode_warning(selection_mode: SelectionMode):
     """Check if the selection_mode value is valid or raise exception otherwise."""
-    if selection_mode not in ["single", "multiple"]:
+    if selection_mode not in _SELECTION_MODES:
         raise StreamlitAPIException(
             "The selection_mode argument must be one of ['single', 'multiple']. "
             f"The argument passed was '{selection_mode}'."
@@ -357,7 +397,7 @@ class ButtonGroupMixin:
 
         """
 
-        if options not in ["thumbs", "faces", "stars"]:
+        if not isinstance(options, str) or options not in _MAPPED_FEEDBACK_OPTIONS:
             raise StreamlitAPIException(
                 "The options argument to st.feedback must be one of "
                 "['thumbs', 'faces', 'stars']. "
@@ -407,30 +447,6 @@ class ButtonGroupMixin:
     ) -> list[V] | V | None:
         maybe_raise_label_warnings(label, label_visibility)
 
-        def _transformed_format_func(option: V) -> ButtonGroupProto.Option:
-            """If option starts with a material icon or an emoji, we extract it to send
-            it parsed to the frontend."""
-            transformed = format_func(option) if format_func else str(option)
-            transformed_parts = transformed.split(" ")
-            icon: str | None = None
-            if len(transformed_parts) > 0:
-                maybe_icon = transformed_parts[0].strip()
-                try:
-                    # we only want to extract material icons because we treat them
-                    # differently than emojis visually
-                    if maybe_icon.startswith(":material"):
-                        icon = validate_material_icon(maybe_icon)
-                        # reassamble the option string without the icon - also
-                        # works if len(transformed_parts) == 1
-                        transformed = " ".join(transformed_parts[1:])
-                except StreamlitAPIException:
-                    # we don't have a valid icon or emoji, so we just pass
-                    pass
-            return ButtonGroupProto.Option(
-                content=transformed,
-                content_icon=icon,
-            )
-
         indexable_options = convert_to_sequence_and_check_comparable(options)
         default_values = get_default_indices(indexable_options, default)
 
@@ -443,7 +459,7 @@ class ButtonGroupMixin:
             default=default_values,
             selection_mode=selection_mode,
             disabled=disabled,
-            format_func=_transformed_format_func,
+            format_func=partial(_transformed_format_func, format_func),
             serializer=serde.serialize,
             deserializer=serde.deserialize,
             on_change=on_change,
@@ -475,30 +491,6 @@ class ButtonGroupMixin:
         args: WidgetArgs | None = None,
         kwargs: WidgetKwargs | None = None,
     ) -> list[V] | V | None:
-        def _transformed_format_func(option: V) -> ButtonGroupProto.Option:
-            """If option starts with a material icon or an emoji, we extract it to send
-            it parsed to the frontend."""
-            transformed = format_func(option) if format_func else str(option)
-            transformed_parts = transformed.split(" ")
-            icon: str | None = None
-            if len(transformed_parts) > 0:
-                maybe_icon = transformed_parts[0].strip()
-                try:
-                    # we only want to extract material icons because we treat them
-                    # differently than emojis visually
-                    if maybe_icon.startswith(":material"):
-                        icon = validate_material_icon(maybe_icon)
-                        # reassamble the option string without the icon - also
-                        # works if len(transformed_parts) == 1
-                        transformed = " ".join(transformed_parts[1:])
-                except StreamlitAPIException:
-                    # we don't have a valid icon or emoji, so we just pass
-                    pass
-            return ButtonGroupProto.Option(
-                content=transformed,
-                content_icon=icon,
-            )
-
         indexable_options = convert_to_sequence_and_check_comparable(options)
         default_values = get_default_indices(indexable_options, default)
 
@@ -512,7 +504,7 @@ class ButtonGroupMixin:
             default=default_values,
             selection_mode=selection_mode,
             disabled=disabled,
-            format_func=_transformed_format_func,
+            format_func=partial(_transformed_format_func, format_func),
             style=style,
             serializer=serde.serialize,
             deserializer=serde.deserialize,
@@ -570,7 +562,7 @@ class ButtonGroupMixin:
                 "`selection_mode='single'`."
             )
 
-        if style not in ["segment", "pills", "borderless"]:
+        if style not in _STYLES:
             raise StreamlitAPIException(
                 "The style argument must be one of ['segment', 'pills', 'borderless']. "
                 f"The argument passed was '{style}'."
@@ -590,10 +582,7 @@ class ButtonGroupMixin:
         formatted_options = (
             indexable_options
             if format_func is None
-            else [
-                format_func(indexable_options[index])
-                for index, _ in enumerate(indexable_options)
-            ]
+            else [format_func(option) for option in indexable_options]
         )
         element_id = compute_and_register_element_id(
             widget_name,
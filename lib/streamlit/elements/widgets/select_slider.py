@@ -367,12 +367,20 @@ class SelectSliderMixin:
         # Convert element to index of the elements
         slider_value = as_index_list(value)
 
+        # Format the options only once, since they are needed for both the
+        # element ID and the proto. With the default format_func, we can skip
+        # the per-option Python call and let `str` be mapped directly.
+        if format_func is str:
+            formatted_options = list(map(str, opt))
+        else:
+            formatted_options = [str(format_func(option)) for option in opt]
+
         element_id = compute_and_register_element_id(
             "select_slider",
             user_key=key,
             form_id=current_form_id(self.dg),
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             value=slider_value,
             help=help,
         )
@@ -387,7 +395,7 @@ class SelectSliderMixin:
         slider_proto.max = len(opt) - 1
         slider_proto.step = 1  # default for index changes
         slider_proto.data_type = SliderProto.INT
-        slider_proto.options[:] = [str(format_func(option)) for option in opt]
+        slider_proto.options[:] = formatted_options
         slider_proto.form_id = current_form_id(self.dg)
         slider_proto.disabled = disabled
         slider_proto.label_visibility.value = get_label_visibility_proto_value(
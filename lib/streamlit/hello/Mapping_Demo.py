@@ -30,11 +30,18 @@ def mapping_demo():
         )
         return pd.read_json(url)
 
-    try:
-        ALL_LAYERS = {
+    # The layers convert their data to a list of records, so we create them only
+    # once and share them across reruns.
+    @st.cache_resource
+    def get_layers():
+        bike_rental_stats = from_data_file("bike_rental_stats.json")
+        bart_stop_stats = from_data_file("bart_stop_stats.json")
+        bart_path_stats = from_data_file("bart_path_stats.json")
+
+        return {
             "Bike Rentals": pdk.Layer(
                 "HexagonLayer",
-                data=from_data_file("bike_rental_stats.json"),
+                data=bike_rental_stats,
                 get_position=["lon", "lat"],
                 radius=200,
                 elevation_scale=4,
@@ -43,7 +50,7 @@ def mapping_demo():
             ),
             "Bart Stop Exits": pdk.Layer(
                 "ScatterplotLayer",
-                data=from_data_file("bart_stop_stats.json"),
+                data=bart_stop_stats,
                 get_position=["lon", "lat"],
                 get_color=[200, 30, 0, 160],
                 get_radius="[exits]",
@@ -51,7 +58,7 @@ def mapping_demo():
             ),
             "Bart Stop Names": pdk.Layer(
                 "TextLayer",
-                data=from_data_file("bart_stop_stats.json"),
+                data=bart_stop_stats,
                 get_position=["lon", "lat"],
                 get_text="name",
                 get_color=[0, 0, 0, 200],
@@ -60,7 +67,7 @@ def mapping_demo():
             ),
             "Outbound Flow": pdk.Layer(
                 "ArcLayer",
-                data=from_data_file("bart_path_stats.json"),
+                data=bart_path_stats,
                 get_source_position=["lon", "lat"],
                 get_target_position=["lon2", "lat2"],
                 get_source_color=[200, 30, 0, 160],
@@ -72,6 +79,9 @@ def mapping_demo():
                 width_max_pixels=30,
             ),
         }
+
+    try:
+        ALL_LAYERS = get_layers()
         st.sidebar.markdown("### Map Layers")
         selected_layers = [
             layer
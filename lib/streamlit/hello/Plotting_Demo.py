@@ -26,12 +26,14 @@ def plotting_demo():
     last_rows = np.random.randn(1, 1)
     chart = st.line_chart(last_rows)
 
+    # Generate the whole random walk upfront and add it in batches of 5 rows.
+    rows = last_rows[-1, :] + np.random.randn(500, 1).cumsum(axis=0)
+
     for i in range(1, 101):
-        new_rows = last_rows[-1, :] + np.random.randn(5, 1).cumsum(axis=0)
+        new_rows = rows[(i - 1) * 5 : i * 5]
         status_text.text("%i%% Complete" % i)
         chart.add_rows(new_rows)
         progress_bar.progress(i)
-        last_rows = new_rows
         time.sleep(0.05)
 
     progress_bar.empty()
@@ -162,17 +162,18 @@ class DataCaches(CacheStatsProvider):
 
         ttl_seconds = time_to_seconds(ttl, coerce_none_to_inf=False)
 
+        # Fast path: most calls find an existing cache with unchanged params.
+        # A single dict read is atomic, so we don't need the lock for this.
+        cache = self._function_caches.get(key)
+        if self._cache_has_params(cache, persist, max_entries, ttl_seconds):
+            return cast(DataCache, cache)
+
         # Get the existing cache, if it exists, and validate that its params
         # haven't changed.
         with self._caches_lock:
             cache = self._function_caches.get(key)
-            if (
-                cache is not None
-                and cache.ttl_seconds == ttl_seconds
-                and cache.max_entries == max_entries
-                and cache.persist == persist
-            ):
-                return cache
+            if self._cache_has_params(cache, persist, max_entries, ttl_seconds):
+                return cast(DataCache, cache)
 
             # Close the existing cache's storage, if it exists.
             if cache is not None:
@@ -217,6 +218,20 @@ class DataCaches(CacheStatsProvider):
             self._function_caches[key] = cache
             return cache
 
+    @staticmethod
+    def _cache_has_params(
+        cache: DataCache | None,
+        persist: CachePersistType,
+        max_entries: int | None,
+        ttl_seconds: float | None,
+    ) -> bool:
+        return (
+            cache is not None
+            and cache.ttl_seconds == ttl_seconds
+            and cache.max_entries == max_entries
+            and cache.persist == persist
+        )
+
     def clear_all(self) -> None:
         """Clear all in-memory and on-disk caches."""
         with self._caches_lock:
@@ -234,12 +249,12 @@ class DataCaches(CacheStatsProvider):
 
     def get_stats(self) -> list[CacheStat]:
         with self._caches_lock:
-            # Shallow-clone our caches. We don't want to hold the global
+            # Snapshot our caches. We don't want to hold the global
             # lock during stats-gathering.
-            function_caches = self._function_caches.copy()
+            function_caches = tuple(self._function_caches.values())
 
         stats: list[CacheStat] = []
-        for cache in function_caches.values():
+        for cache in function_caches:
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
@@ -572,16 +587,7 @@ class CacheDataAPI:
         if func is None:
             return wrapper
 
-        return make_cached_func_wrapper(
-            CachedDataFuncInfo(
-                func=cast(types.FunctionType, func),
-                persist=persist_string,
-                show_spinner=show_spinner,
-                max_entries=max_entries,
-                ttl=ttl,
-                hash_funcs=hash_funcs,
-            )
-        )
+        return wrapper(cast(types.FunctionType, func))
 
     @gather_metrics("clear_data_caches")
     def clear(self) -> None:
@@ -646,7 +652,7 @@ class DataCache(Cache):
             main_id = st._main.id
             sidebar_id = st.sidebar.id
             entry = CachedResult(value, messages, main_id, sidebar_id)
-            pickled_entry = pickle.dumps(entry)
+            pickled_entry = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
         self.storage.set(key, pickled_entry)
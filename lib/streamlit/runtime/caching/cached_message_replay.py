@@ -149,8 +149,15 @@ class CachedMessageReplayContext(threading.local):
         try:
             yield
         finally:
-            self._most_recent_messages = self._cached_message_stack.pop()
-            self._seen_dg_stack.pop()
+            messages = self._cached_message_stack.pop()
+            seen_dgs = self._seen_dg_stack.pop()
+            # Messages and DGs produced inside a nested cached function also
+            # belong to the enclosing one, so we hand them up the stack once
+            # it returns.
+            if self._cached_message_stack:
+                self._cached_message_stack[-1].extend(messages)
+                self._seen_dg_stack[-1].update(seen_dgs)
+            self._most_recent_messages = messages
             if not nested_call:
                 # Reset the in_cached_function flag. But only if this
                 # is not nested inside a cached function that disallows widget usage.
@@ -168,9 +175,8 @@ class CachedMessageReplayContext(threading.local):
         executing cached functions, so they can be replayed any time the function's
         execution is skipped because they're in the cache.
         """
-        if not runtime.exists():
-            return
-        if len(self._cached_message_stack) >= 1:
+        message_stack = self._cached_message_stack
+        if message_stack and runtime.exists():
             id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
 
             media_data = self._media_data
@@ -182,16 +188,13 @@ class CachedMessageReplayContext(threading.local):
                 returned_dg_id,
                 media_data,
             )
-            for msgs in self._cached_message_stack:
-                msgs.append(element_msg_data)
+            message_stack[-1].append(element_msg_data)
+            self._seen_dg_stack[-1].add(returned_dg_id)
 
         # Reset instance state, now that it has been used for the
         # associated element.
         self._media_data = []
 
-        for s in self._seen_dg_stack:
-            s.add(returned_dg_id)
-
     def save_block_message(
         self,
         block_proto: Block,
@@ -199,11 +202,13 @@ class CachedMessageReplayContext(threading.local):
         used_dg_id: str,
         returned_dg_id: str,
     ) -> None:
-        id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
-        for msgs in self._cached_message_stack:
-            msgs.append(BlockMsgData(block_proto, id_to_save, returned_dg_id))
-        for s in self._seen_dg_stack:
-            s.add(returned_dg_id)
+        message_stack = self._cached_message_stack
+        if message_stack:
+            id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
+            message_stack[-1].append(
+                BlockMsgData(block_proto, id_to_save, returned_dg_id)
+            )
+            self._seen_dg_stack[-1].add(returned_dg_id)
 
     def select_dg_to_save(self, invoked_id: str, acting_on_id: str) -> str:
         """Select the id of the DG that this message should be invoked on
@@ -215,7 +220,8 @@ class CachedMessageReplayContext(threading.local):
         acting_on_id is the DG the st function ultimately runs on, which may be different
         if the invoked DG delegated to another one because it was in a `with` block.
         """
-        if len(self._seen_dg_stack) > 0 and acting_on_id in self._seen_dg_stack[-1]:
+        seen_dg_stack = self._seen_dg_stack
+        if seen_dg_stack and acting_on_id in seen_dg_stack[-1]:
             return acting_on_id
         else:
             return invoked_id
@@ -255,11 +261,10 @@ def replay_cached_messages(
     try:
         for msg in result.messages:
             if isinstance(msg, ElementMsgData):
-                if msg.media_data is not None:
+                if msg.media_data:
+                    media_file_mgr = runtime.get_instance().media_file_mgr
                     for data in msg.media_data:
-                        runtime.get_instance().media_file_mgr.add(
-                            data.media, data.mimetype, data.media_id
-                        )
+                        media_file_mgr.add(data.media, data.mimetype, data.media_id)
                 dg = returned_dgs[msg.id_of_dg_called_on]
                 maybe_dg = dg._enqueue(msg.delta_type, msg.message)
                 if isinstance(maybe_dg, DeltaGenerator):
@@ -63,7 +63,7 @@ import os
 import shutil
 from typing import Final
 
-from streamlit import errors
+from streamlit import errors, util
 from streamlit.file_util import get_streamlit_file_path, streamlit_read, streamlit_write
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -88,6 +88,8 @@ _CACHE_DIR_NAME: Final = "cache"
 # (`@st.cache_data` was originally called `@st.memo`)
 _CACHED_FILE_EXTENSION: Final = "memo"
 
+_CACHED_FILE_SUFFIX: Final = f".{_CACHED_FILE_EXTENSION}"
+
 
 class LocalDiskCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -125,6 +127,7 @@ class LocalDiskCacheStorage(CacheStorage):
         self.persist = context.persist
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
+        self._file_prefix = f"{self.function_key}-"
 
     @property
     def ttl_seconds(self) -> float:
@@ -198,26 +201,27 @@ class LocalDiskCacheStorage(CacheStorage):
             # We try to remove all files in the cache directory that start with
             # the function key, whether `clear` called for `self.persist`
             # storage or not, to avoid leaving orphaned files in the cache directory.
-            for file_name in os.listdir(cache_dir):
-                if self._is_cache_file(file_name):
-                    os.remove(os.path.join(cache_dir, file_name))
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if self._is_cache_file(entry.name):
+                        os.remove(entry.path)
 
     def close(self) -> None:
         """Dummy implementation of close, we don't need to actually "close" anything"""
 
     def _get_cache_file_path(self, value_key: str) -> str:
         """Return the path of the disk cache file for the given value."""
-        cache_dir = get_cache_folder_path()
         return os.path.join(
-            cache_dir, f"{self.function_key}-{value_key}.{_CACHED_FILE_EXTENSION}"
+            get_cache_folder_path(), self._file_prefix + value_key + _CACHED_FILE_SUFFIX
         )
 
     def _is_cache_file(self, fname: str) -> bool:
         """Return true if the given file name is a cache file for this storage."""
-        return fname.startswith(f"{self.function_key}-") and fname.endswith(
-            f".{_CACHED_FILE_EXTENSION}"
+        return fname.startswith(self._file_prefix) and fname.endswith(
+            _CACHED_FILE_SUFFIX
         )
 
 
+@util.memoize
 def get_cache_folder_path() -> str:
     return get_streamlit_file_path(_CACHE_DIR_NAME)
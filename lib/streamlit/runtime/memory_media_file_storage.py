@@ -16,10 +16,10 @@
 
 from __future__ import annotations
 
-import contextlib
 import hashlib
 import mimetypes
 import os.path
+from functools import lru_cache
 from typing import Final, NamedTuple
 
 from streamlit.logger import get_logger
@@ -28,7 +28,7 @@ from streamlit.runtime.media_file_storage import (
     MediaFileStorage,
     MediaFileStorageError,
 )
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
 from streamlit.util import HASHLIB_KWARGS
 
 _LOGGER: Final = get_logger(__name__)
@@ -55,16 +55,16 @@ def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None)
     filename
         Any string. Will be converted to bytes and used to compute a hash.
     """
-    filehash = hashlib.new("sha224", **HASHLIB_KWARGS)
-    filehash.update(data)
-    filehash.update(bytes(mimetype.encode()))
+    filehash = hashlib.sha224(data, **HASHLIB_KWARGS)
+    filehash.update(mimetype.encode())
 
     if filename is not None:
-        filehash.update(bytes(filename.encode()))
+        filehash.update(filename.encode())
 
     return filehash.hexdigest()
 
 
+@lru_cache(maxsize=256)
 def get_extension_for_mimetype(mimetype: str) -> str:
     if mimetype in PREFERRED_MIMETYPE_EXTENSION_MAP:
         return PREFERRED_MIMETYPE_EXTENSION_MAP[mimetype]
@@ -153,10 +153,8 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
 
     def delete_file(self, file_id: str) -> None:
         """Delete the file with the given ID."""
-        # We swallow KeyErrors here - it's not an error to delete a file
-        # that doesn't exist.
-        with contextlib.suppress(KeyError):
-            del self._files_by_id[file_id]
+        # It's not an error to delete a file that doesn't exist.
+        self._files_by_id.pop(file_id, None)
 
     def _read_file(self, filename: str) -> bytes:
         """Read a file into memory. Raise MediaFileStorageError if we can't."""
@@ -167,16 +165,18 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
             raise MediaFileStorageError(f"Error opening '{filename}'") from ex
 
     def get_stats(self) -> list[CacheStat]:
-        # We operate on a copy of our dict, to avoid race conditions
+        # We operate on a snapshot of our files, to avoid race conditions
         # with other threads that may be manipulating the cache.
-        files_by_id = self._files_by_id.copy()
+        files = list(self._files_by_id.values())
+        if not files:
+            return []
 
-        stats: list[CacheStat] = [
+        # All of our files belong to a single cache, so we report them as one
+        # grouped stat rather than grouping per-file stats after the fact.
+        return [
             CacheStat(
                 category_name="st_memory_media_file_storage",
                 cache_name="",
-                byte_length=len(file.content),
+                byte_length=sum(file.content_size for file in files),
             )
-            for _, file in files_by_id.items()
         ]
-        return group_stats(stats)
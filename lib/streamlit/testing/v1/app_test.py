@@ -210,8 +210,10 @@ class AppTest:
         script_name = hasher.hexdigest()
 
         path = Path(TMP_DIR.name, script_name)
-        aligned_script = textwrap.dedent(script)
-        path.write_text(aligned_script)
+        # The file name is derived from the script's contents, so if it already
+        # exists we've written this exact script before.
+        if not path.exists():
+            path.write_text(textwrap.dedent(script))
         return AppTest(
             str(path), default_timeout=default_timeout, args=args, kwargs=kwargs
         )
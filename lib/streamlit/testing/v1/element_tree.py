@@ -1474,9 +1474,14 @@ class Block:
         return len(self.children)
 
     def __iter__(self):
-        yield self
-        for child_idx in self.children:
-            yield from self.children[child_idx]
+        # Walk the subtree with an explicit stack instead of nested generators,
+        # so deeply nested elements aren't passed up through every ancestor.
+        stack: list[Node] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, Block):
+                stack.extend(reversed(node.children.values()))
 
     def __getitem__(self, k: int) -> Node:
         return self.children[k]
@@ -1724,9 +1729,7 @@ class SpecialBlock(Block):
         self.proto = proto
         if type:
             self.type = type
-        elif proto and proto.WhichOneof("type"):
-            ty = proto.WhichOneof("type")
-            assert ty is not None
+        elif proto and (ty := proto.WhichOneof("type")):
             self.type = ty
         else:
             self.type = "unknown"
@@ -1878,6 +1881,7 @@ class ElementTree(Block):
     """
 
     _runner: AppTest | None = field(repr=False, default=None)
+    _nodes_by_type: dict[str, list[Node]] | None = field(repr=False, default=None)
 
     def __init__(self):
         self.children = {}
@@ -1901,6 +1905,16 @@ class ElementTree(Block):
         assert self._runner is not None
         return self._runner.session_state
 
+    def get(self, element_type: str) -> Sequence[Node]:
+        # The tree doesn't change once it has been parsed, so we group its nodes
+        # by type on the first query instead of walking the tree for each one.
+        if self._nodes_by_type is None:
+            nodes_by_type: dict[str, list[Node]] = {}
+            for node in self:
+                nodes_by_type.setdefault(node.type, []).append(node)
+            self._nodes_by_type = nodes_by_type
+        return list(self._nodes_by_type.get(element_type, ()))
+
     def get_widget_states(self) -> WidgetStates:
         ws = WidgetStates()
         for node in self:
@@ -1947,7 +1961,8 @@ def parse_tree_from_messages(messages: list[ForwardMsg]) -> ElementTree:
             continue
         delta_path = msg.metadata.delta_path
         delta = msg.delta
-        if delta.WhichOneof("type") == "new_element":
+        delta_type = delta.WhichOneof("type")
+        if delta_type == "new_element":
             elt = delta.new_element
             ty = elt.WhichOneof("type")
             new_node: Node
@@ -2042,7 +2057,7 @@ def parse_tree_from_messages(messages: list[ForwardMsg]) -> ElementTree:
                 new_node = Toast(elt.toast, root=root)
             else:
                 new_node = UnknownElement(elt, root=root)
-        elif delta.WhichOneof("type") == "add_block":
+        elif delta_type == "add_block":
             block = delta.add_block
             bty = block.WhichOneof("type")
             if bty == "chat_message":
@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 import os
-import time
+import threading
 import types
 from typing import TYPE_CHECKING, Any
 from urllib import parse
@@ -71,6 +71,8 @@ class LocalScriptRunner(ScriptRunner):
         # Accumulates all ScriptRunnerEvents emitted by us.
         self.events: list[ScriptRunnerEvent] = []
         self.event_data: list[Any] = []
+        # Set once we've seen the SHUTDOWN event.
+        self._shutdown_event = threading.Event()
 
         def record_event(
             sender: ScriptRunner | None, event: ScriptRunnerEvent, **kwargs
@@ -84,6 +86,9 @@ class LocalScriptRunner(ScriptRunner):
             self.events.append(event)
             self.event_data.append(kwargs)
 
+            if event == ScriptRunnerEvent.SHUTDOWN:
+                self._shutdown_event.set()
+
             # Send ENQUEUE_FORWARD_MSGs to our queue
             if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
                 forward_msg = kwargs["forward_msg"]
@@ -131,10 +136,7 @@ class LocalScriptRunner(ScriptRunner):
         return tree
 
     def script_stopped(self) -> bool:
-        for e in self.events:
-            if e == ScriptRunnerEvent.SHUTDOWN:
-                return True
-        return False
+        return self._shutdown_event.is_set()
 
     def _on_script_finished(
         self, ctx: ScriptRunContext, event: ScriptRunnerEvent, premature_stop: bool
@@ -162,11 +164,8 @@ def require_widgets_deltas(runner: LocalScriptRunner, timeout: float = 3) -> Non
     is reached, the runner will be shutdown and an error will be thrown.
     """
 
-    t0 = time.time()
-    while time.time() - t0 < timeout:
-        time.sleep(0.001)
-        if runner.script_stopped():
-            return
+    if runner._shutdown_event.wait(timeout):
+        return
 
     # If we get here, the runner hasn't yet completed before our
     # timeout. Create an error string for debugging.
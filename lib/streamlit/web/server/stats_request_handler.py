@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import tornado.web
 
@@ -25,6 +25,13 @@ if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
     from streamlit.runtime.stats import CacheStat, StatsManager
 
+_OPENMETRICS_HEADER: Final = (
+    "# TYPE cache_memory_bytes gauge\n"
+    "# UNIT cache_memory_bytes bytes\n"
+    "# HELP Total memory consumed by a cache."
+)
+_OPENMETRICS_EOF: Final = "# EOF\n"
+
 
 class StatsRequestHandler(tornado.web.RequestHandler):
     def initialize(self, stats_manager: StatsManager) -> None:
@@ -52,21 +59,16 @@ class StatsRequestHandler(tornado.web.RequestHandler):
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(self._stats_to_text(stats))
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
     def _stats_to_text(stats: list[CacheStat]) -> str:
-        metric_type = "# TYPE cache_memory_bytes gauge"
-        metric_unit = "# UNIT cache_memory_bytes bytes"
-        metric_help = "# HELP Total memory consumed by a cache."
-        openmetrics_eof = "# EOF\n"
-
         # Format: header, stats, EOF
-        result = [metric_type, metric_unit, metric_help]
-        result.extend(stat.to_metric_str() for stat in stats)
-        result.append(openmetrics_eof)
+        result = [_OPENMETRICS_HEADER]
+        result += [stat.to_metric_str() for stat in stats]
+        result.append(_OPENMETRICS_EOF)
 
         return "\n".join(result)
 
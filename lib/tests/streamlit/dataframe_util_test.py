@@ -788,6 +788,31 @@ class DataframeUtilTest(unittest.TestCase):
         converted_list = dataframe_util.convert_anything_to_list(StrOpt)
         self.assertEqual(list(StrOpt), converted_list)
 
+    def test_convert_anything_to_sequence_series(self):
+        """Test that a Series is converted to a new list of its values."""
+        series = pd.Series(["a", "b", "c"], index=[2, 1, 0])
+        converted_list = dataframe_util.convert_anything_to_list(series)
+
+        self.assertEqual(["a", "b", "c"], converted_list)
+        self.assertIsInstance(converted_list, list)
+
+    def test_convert_anything_to_sequence_1d_array(self):
+        """Test that a 1-D array is converted to a list of Python scalars."""
+        converted_list = dataframe_util.convert_anything_to_list(np.array([1, 2, 3]))
+
+        self.assertEqual([1, 2, 3], converted_list)
+        self.assertIsInstance(converted_list, list)
+        self.assertTrue(all(type(item) is int for item in converted_list))
+
+    def test_convert_anything_to_sequence_structured_array(self):
+        """Test that a structured array uses its first field as options."""
+        structured_array = np.array(
+            [(1, "a"), (2, "b")], dtype=[("x", int), ("y", "U1")]
+        )
+        converted_list = dataframe_util.convert_anything_to_list(structured_array)
+
+        self.assertEqual([1, 2], converted_list)
+
     @parameterized.expand(
         SHARED_TEST_CASES,
     )
@@ -190,6 +190,15 @@ class TestFeedbackCommand(DeltaGeneratorTestCase):
             "['thumbs', 'faces', 'stars']. The argument passed was 'foo'."
         ) == str(e.value)
 
+    def test_invalid_option_unhashable(self):
+        with pytest.raises(StreamlitAPIException) as e:
+            st.feedback(["thumbs", "stars"])
+        assert (
+            "The options argument to st.feedback must be one of "
+            "['thumbs', 'faces', 'stars']. "
+            "The argument passed was '['thumbs', 'stars']'."
+        ) == str(e.value)
+
     @parameterized.expand([(0,), (1,)])
     def test_widget_state_changed_via_session_state(self, session_state_index: int):
         st.session_state.feedback_command_key = session_state_index
@@ -739,6 +748,16 @@ class ButtonGroupCommandTests(DeltaGeneratorTestCase):
             "The argument passed was 'foo'." == str(exception.value)
         )
 
+    @parameterized.expand(get_command_matrix([]))
+    def test_invalid_selection_mode_unhashable(self, command: Callable[..., None]):
+        """Test that passing an unhashable selection_mode raises an exception."""
+        with pytest.raises(StreamlitAPIException) as exception:
+            command(["a", "b"], selection_mode=["single"])
+        assert (
+            "The selection_mode argument must be one of ['single', 'multiple']. "
+            "The argument passed was '['single']'." == str(exception.value)
+        )
+
     @parameterized.expand(get_command_matrix([]))
     def test_widget_state_changed_via_session_state_for_single_select(
         self, command: Callable[..., None]
@@ -766,3 +785,15 @@ class ButtonGroupCommandTests(DeltaGeneratorTestCase):
             "The style argument must be one of ['segment', 'pills', 'borderless']. "
             "The argument passed was 'foo'." == str(exception.value)
         )
+
+    def test_invalid_style_unhashable(self):
+        """Test internal button_group command does not accept an unhashable style."""
+
+        with pytest.raises(StreamlitAPIException) as exception:
+            ButtonGroupMixin._internal_button_group(
+                st._main, ["a", "b", "c"], style=["pills"]
+            )
+        assert (
+            "The style argument must be one of ['segment', 'pills', 'borderless']. "
+            "The argument passed was '['pills']'." == str(exception.value)
+        )
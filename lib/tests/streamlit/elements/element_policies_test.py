@@ -16,7 +16,7 @@ import copy
 import os
 import unittest
 from typing import Final
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -125,6 +125,20 @@ class CheckSessionStateRules(ElementPoliciesTest):
         with self.assertRaises(StreamlitValueAssignmentNotAllowedError):
             check_session_state_rules(5, key=_KEY, writes_allowed=False)
 
+    @patch("streamlit.runtime.Runtime.exists", MagicMock(return_value=True))
+    @patch("streamlit.elements.lib.policies.get_session_state")
+    def test_check_session_state_rules_uses_ctx_session_state(
+        self, patched_get_session_state
+    ):
+        ctx = MagicMock()
+        ctx.session_state.is_new_state_value.return_value = True
+
+        with self.assertRaises(StreamlitValueAssignmentNotAllowedError):
+            check_session_state_rules(5, key=_KEY, writes_allowed=False, ctx=ctx)
+
+        ctx.session_state.is_new_state_value.assert_called_once_with(_KEY)
+        patched_get_session_state.assert_not_called()
+
 
 class SpecialSessionStatesTest(ElementPoliciesTest):
     SECTION_DESCRIPTIONS = copy.deepcopy(config._section_descriptions)
@@ -228,6 +242,15 @@ class FragmentCannotWriteToOutsidePathTest(unittest.TestCase):  #
         dg._active_dg._cursor.delta_path = [0, 1, 2, 0]
         check_fragment_path_policy(dg)
 
+    @patch("streamlit.elements.lib.policies.get_script_run_ctx")
+    def test_uses_passed_in_ctx(self, patched_get_script_run_ctx: MagicMock):
+        dg = MagicMock()
+        dg._active_dg._cursor = MagicMock()
+        dg._active_dg._cursor.delta_path = [0, 1]
+        with self.assertRaises(StreamlitAPIException):
+            check_fragment_path_policy(dg, ctx=self.ctx)
+        patched_get_script_run_ctx.assert_not_called()
+
 
 @patch("streamlit.elements.lib.policies.check_session_state_rules")
 @patch("streamlit.elements.lib.policies.check_callback_rules")
@@ -253,7 +276,7 @@ class CheckWidget(ElementPoliciesTest):
         patched_check_cache_replay_rules.assert_called_once()
         patched_check_callback_rules.assert_called_once_with(dg, on_change)
         patched_check_session_state_rules.assert_called_once_with(
-            default_value=default_value, key=key, writes_allowed=True
+            default_value=default_value, key=key, writes_allowed=True, ctx=ANY
         )
 
     def test_check_callback_rules_is_not_called(
@@ -285,5 +308,5 @@ class CheckWidget(ElementPoliciesTest):
         patched_check_cache_replay_rules.assert_called_once()
         patched_check_callback_rules.assert_called_once()
         patched_check_session_state_rules.assert_called_once_with(
-            default_value=None, key=key, writes_allowed=False
+            default_value=None, key=key, writes_allowed=False, ctx=ANY
         )
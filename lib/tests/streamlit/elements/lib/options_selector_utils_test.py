@@ -64,6 +64,38 @@ class TestCheckAndConvertToIndices:
         with pytest.raises(StreamlitAPIException):
             check_and_convert_to_indices(["a", "b"], "c")
 
+    def test_check_and_convert_to_indices_duplicate_options(self):
+        res = check_and_convert_to_indices(["a", "b", "a", "b"], ["b", "a"])
+        assert res == [1, 0]
+
+    def test_check_and_convert_to_indices_unhashable_options(self):
+        res = check_and_convert_to_indices([["a"], ["b"]], [["b"]])
+        assert res == [1]
+
+    def test_check_and_convert_to_indices_unhashable_default_not_in_opts(self):
+        with pytest.raises(StreamlitAPIException):
+            check_and_convert_to_indices([["a"], ["b"]], [["c"]])
+
+    def test_check_and_convert_to_indices_empty_default(self):
+        res = check_and_convert_to_indices(["a", "b"], [])
+        assert res == []
+
+    def test_check_and_convert_to_indices_many_defaults(self):
+        options = [str(i) for i in range(20)] * 2
+        default = [str(i) for i in reversed(range(20))]
+        res = check_and_convert_to_indices(options, default)
+        assert res == list(reversed(range(20)))
+
+    def test_check_and_convert_to_indices_many_defaults_not_in_opts(self):
+        options = [str(i) for i in range(20)]
+        with pytest.raises(StreamlitAPIException):
+            check_and_convert_to_indices(options, options[:10] + ["foo"])
+
+    def test_check_and_convert_to_indices_many_unhashable_defaults(self):
+        options = [[i] for i in range(20)]
+        res = check_and_convert_to_indices(options, options[5:15])
+        assert res == list(range(5, 15))
+
 
 class TestTransformOptions:
     def test_transform_options(self):
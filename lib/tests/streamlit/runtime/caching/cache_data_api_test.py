@@ -21,6 +21,7 @@ import os
 import pickle
 import re
 import threading
+import types
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
@@ -405,15 +406,18 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             mock_open.call_args_list[1][0][0],
         }
 
-        created_files_base_names = [
-            os.path.basename(filename) for filename in created_filenames
+        created_files_entries = [
+            types.SimpleNamespace(name=os.path.basename(filename), path=filename)
+            for filename in created_filenames
         ]
+        mock_scandir = MagicMock()
+        mock_scandir.return_value.__enter__.return_value = created_files_entries
 
         mock_os_remove.assert_not_called()
 
-        with patch(
-            "os.listdir", MagicMock(return_value=created_files_base_names)
-        ), patch("os.path.isdir", MagicMock(return_value=True)):
+        with patch("os.scandir", mock_scandir), patch(
+            "os.path.isdir", MagicMock(return_value=True)
+        ):
             # Clear foo's cache
             foo.clear()
 
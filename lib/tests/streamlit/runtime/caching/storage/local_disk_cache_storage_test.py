@@ -257,20 +257,20 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
         self.tempdir.cleanup()
         self.storage.clear()
 
-    def test_storage_clear_call_listdir_existing_cache_directory(self):
-        """Test that clear() call os.listdir if cache folder does not exist."""
-        with patch("os.listdir") as mock_listdir:
+    def test_storage_clear_call_scandir_existing_cache_directory(self):
+        """Test that clear() call os.scandir if cache folder does not exist."""
+        with patch("os.scandir") as mock_scandir:
             self.storage.clear()
-        mock_listdir.assert_called_once()
+        mock_scandir.assert_called_once()
 
-    def test_storage_clear_not_call_listdir_not_existing_cache_directory(self):
-        """Test that clear() doesn't call os.listdir if cache folder does not exist."""
+    def test_storage_clear_not_call_scandir_not_existing_cache_directory(self):
+        """Test that clear() doesn't call os.scandir if cache folder does not exist."""
         self.tempdir.cleanup()
 
-        with patch("os.listdir") as mock_listdir:
+        with patch("os.scandir") as mock_scandir:
             self.storage.clear()
 
-        mock_listdir.assert_not_called()
+        mock_scandir.assert_not_called()
 
     def test_storage_close(self):
         """Test that storage.close() does not raise any exception."""